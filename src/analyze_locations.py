@@ -13,30 +13,72 @@ Configuration is read from config.yaml by default.
 """
 
 import argparse
+import codecs
+import logging
 import os
 import sys
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
-import pandas as pd
-import yaml
+logger = logging.getLogger(__name__)
+
+# Summary of one SOC code's wage distribution; percentile is the share of
+# locations whose wage level is at or below the configured hourly wage
+WageStats = namedtuple("WageStats", "min q25 median q75 max percentile")
 
 
 class LOCAnalyzer:
     """Analyzes OFLC wage data to find eligible locations."""
 
+    # Columns read from the source files; everything else is skipped at parse time
+    ALC_COLUMNS = [
+        "SocCode", "Area", "Level1", "Level2", "Level3", "Level4",
+        "Average", "Label"
+    ]
+    GEOGRAPHY_COLUMNS = ["Area", "AreaName", "StateAb", "State", "CountyTownName"]
+    WAGE_COLUMNS = ["Level1", "Level2", "Level3", "Level4", "Average"]
+
+    # Config operator -> NumPy ufunc name, applied as ufunc(level_wages, hourly_wage).
+    # The config reads "hourly_wage OP level", hence the inverted comparisons.
+    COMPARISON_UFUNCS = {
+        ">=": "less_equal",
+        ">": "less",
+        "<=": "greater_equal",
+        "<": "greater",
+    }
+
     def __init__(self, config_path="config.yaml"):
         """Initialize analyzer with configuration."""
         self.config = self._load_config(config_path)
+        self.verbose = self.config.get('verbose', True)
+        self._log("✓ Configuration loaded from {}", config_path)
         self.project_root = Path(__file__).parent.parent
         self._validate_config()
 
+    def _log(self, msg, *args):
+        """Report a progress message; a no-op when verbose output is disabled.
+
+        ``msg`` is a ``str.format`` template, only formatted when the message is
+        shown. Messages go to the module logger when logging is configured and
+        are printed otherwise.
+        """
+        if not self.verbose:
+            return
+        text = msg.format(*args) if args else msg
+        if logger.hasHandlers():
+            logger.info(text)
+        else:
+            print(text)
+
     def _load_config(self, config_path):
         """Load configuration from YAML file."""
+        import yaml
+
         try:
             with open(config_path, 'r') as f:
                 config = yaml.safe_load(f)
-            print(f"✓ Configuration loaded from {config_path}")
             return config
         except FileNotFoundError:
             print(f"✗ Error: Configuration file '{config_path}' not found")
@@ -65,11 +107,18 @@ class LOCAnalyzer:
             print("✗ Error: data_year must be specified in config")
             sys.exit(1)
 
-        print(f"✓ Configuration validated")
-        print(f"  - Hourly wage: ${hourly_wage}")
-        print(f"  - Wage level: {wage_level} (compares against {wage_level.replace('L', 'Level')} column)")
-        print(f"  - SOC code: {self.config.get('soc_code')}")
-        print(f"  - Data year: {data_year}")
+        # Validate comparison operator
+        operator = self.config.get('advanced', {}).get('comparison_operator', '>=')
+        if operator not in self.COMPARISON_UFUNCS:
+            print(f"✗ Error: Invalid comparison operator '{operator}'")
+            sys.exit(1)
+
+        self._log("✓ Configuration validated")
+        self._log("  - Hourly wage: ${}", hourly_wage)
+        self._log("  - Wage level: {} (compares against {} column)",
+                  wage_level, wage_level.replace('L', 'Level'))
+        self._log("  - SOC code: {}", self.config.get('soc_code'))
+        self._log("  - Data year: {}", data_year)
 
     def _get_data_paths(self):
         """Construct paths to data files based on configuration."""
@@ -99,68 +148,237 @@ class LOCAnalyzer:
             print(f"✗ Error: Geography file not found: {geography_path}")
             sys.exit(1)
 
-        print(f"✓ Data files located:")
-        print(f"  - ALC: {alc_path}")
-        print(f"  - Geography: {geography_path}")
+        self._log("✓ Data files located:")
+        self._log("  - ALC: {}", alc_path)
+        self._log("  - Geography: {}", geography_path)
 
         return str(alc_path), str(geography_path)
 
     def _load_data(self, alc_path, geography_path):
         """Load and preprocess data files."""
-        print("\nLoading data files...")
-
-        # Load ALC Export data
-        try:
-            alc_data = pd.read_csv(alc_path, low_memory=False)
-            print(f"✓ Loaded ALC data: {alc_data.shape[0]:,} rows, {alc_data.shape[1]} columns")
-        except Exception as e:
-            print(f"✗ Error loading ALC file: {e}")
-            sys.exit(1)
+        self._log("\nLoading data files...")
 
-        # Load Geography data with encoding fallback
         encodings = self.config.get('advanced', {}).get('csv_encodings',
             ['utf-8', 'latin-1', 'iso-8859-1', 'cp1252', 'windows-1252'])
 
-        geography_data = None
-        for encoding in encodings:
+        # Parse both files concurrently; the CSV readers release the GIL while parsing
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            alc_future = executor.submit(self._read_alc, alc_path)
+            geography_future = executor.submit(self._read_geography, geography_path, encodings)
+
             try:
-                geography_data = pd.read_csv(geography_path, encoding=encoding)
-                if encoding != 'utf-8':
-                    print(f"✓ Loaded Geography data with {encoding} encoding")
-                else:
-                    print(f"✓ Loaded Geography data")
-                break
-            except (UnicodeDecodeError, LookupError):
-                continue
+                alc_data = alc_future.result()
+            except Exception as e:
+                print(f"✗ Error loading ALC file: {e}")
+                sys.exit(1)
+
+            geography_data, encoding = geography_future.result()
+
+        self._log("✓ Loaded ALC data: {:,} rows, {} columns", alc_data.shape[0], alc_data.shape[1])
 
         if geography_data is None:
             print("✗ Error: Could not read Geography file with any encoding")
             sys.exit(1)
 
-        print(f"  Geography data: {geography_data.shape[0]:,} rows, {geography_data.shape[1]} columns")
+        if encoding != 'utf-8':
+            self._log("✓ Loaded Geography data with {} encoding", encoding)
+        else:
+            self._log("✓ Loaded Geography data")
+        self._log("  Geography data: {:,} rows, {} columns",
+                  geography_data.shape[0], geography_data.shape[1])
 
         return alc_data, geography_data
 
-    def _clean_wage_columns(self, df):
-        """Clean and convert wage columns to numeric."""
-        wage_columns = ["Level1", "Level2", "Level3", "Level4", "Average"]
+    def _read_alc(self, alc_path):
+        """Read the ALC file, using a Parquet cache of the parsed data when possible.
+
+        The cache sits next to the CSV and holds the projected columns with wage
+        columns already numeric. It is rebuilt whenever the CSV is newer or was
+        written for a different column set.
+        """
+        use_cache = self.config.get('advanced', {}).get('cache_alc', True)
+        cache_path = alc_path + ".parquet"
+        # Stored in the Parquet schema metadata so a column change invalidates the cache
+        cache_key = ",".join(self.ALC_COLUMNS).encode()
 
-        for col in wage_columns:
+        if use_cache and os.path.exists(cache_path) \
+                and os.path.getmtime(cache_path) >= os.path.getmtime(alc_path):
+            try:
+                import pyarrow.parquet as pq
+
+                table = pq.read_table(cache_path)
+                if (table.schema.metadata or {}).get(b"alc_columns") == cache_key:
+                    # Same conversion as a fresh parse so cached and parsed dtypes match
+                    return self._arrow_to_pandas(table)
+            except Exception:
+                pass  # Unreadable cache or no Parquet engine; re-parse the CSV
+
+        alc_data = self._read_csv(alc_path, self.ALC_COLUMNS)
+        # SocCode has few distinct values; categorical codes make filtering an int compare
+        if 'SocCode' in alc_data.columns:
+            alc_data['SocCode'] = alc_data['SocCode'].astype("category")
+
+        if use_cache:
+            alc_data = self._clean_wage_columns(alc_data, self.WAGE_COLUMNS)
+            # Write to a temp file and swap it in, so an interrupted write never
+            # leaves a truncated cache that looks newer than the CSV
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            try:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+
+                table = pa.Table.from_pandas(alc_data, preserve_index=False)
+                table = table.replace_schema_metadata(
+                    {**(table.schema.metadata or {}), b"alc_columns": cache_key}
+                )
+                pq.write_table(table, tmp_path, compression="zstd")
+                os.replace(tmp_path, cache_path)
+            except Exception:
+                # Caching is best effort
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+
+        return alc_data
+
+    def _read_geography(self, geography_path, encodings):
+        """Read the Geography file, trying each encoding in turn.
+
+        Returns the data and the encoding that worked, or (None, None).
+        Encodings that cannot decode the first 64 KB are skipped without
+        parsing the file.
+        """
+        with open(geography_path, 'rb') as f:
+            head = f.read(65536)
+
+        for encoding in encodings:
+            try:
+                # Incremental decode so a multi-byte character cut at 64 KB is not an error
+                codecs.getincrementaldecoder(encoding)().decode(head)
+            except (UnicodeDecodeError, LookupError):
+                continue
+
+            try:
+                geography_data = self._read_csv(
+                    geography_path, self.GEOGRAPHY_COLUMNS, encoding=encoding
+                )
+                return geography_data, encoding
+            except (UnicodeDecodeError, LookupError):
+                continue
+
+        return None, None
+
+    def _read_csv(self, path, columns, **kwargs):
+        """Read only the needed columns of a CSV file as strings.
+
+        Parses straight into Arrow buffers with pyarrow.csv when available
+        (SocCode dictionary-encoded, so it arrives as a categorical) and falls
+        back to the pandas C engine otherwise.
+        """
+        import pandas as pd
+
+        header = pd.read_csv(path, nrows=0, **kwargs).columns
+        usecols = [col for col in columns if col in header]
+
+        try:
+            import pyarrow as pa
+            import pyarrow.csv as pacsv
+
+            column_types = {col: pa.string() for col in usecols}
+            if 'SocCode' in column_types:
+                column_types['SocCode'] = pa.dictionary(pa.int32(), pa.string())
+
+            # Parse from a memory map so the bytes are not copied through read() calls
+            with pa.memory_map(str(path), "r") as source:
+                table = pacsv.read_csv(
+                    source,
+                    read_options=pacsv.ReadOptions(
+                        use_threads=True,
+                        block_size=8 << 20,
+                        encoding=kwargs.get('encoding', 'utf8')
+                    ),
+                    convert_options=pacsv.ConvertOptions(
+                        include_columns=usecols,
+                        column_types=column_types,
+                        # Empty cells are missing values, as with pandas' readers
+                        strings_can_be_null=True
+                    )
+                )
+            return self._arrow_to_pandas(table)
+        except (ImportError, ValueError):
+            return pd.read_csv(path, engine="c", usecols=usecols,
+                               dtype={col: "string" for col in usecols},
+                               low_memory=False, cache_dates=True, **kwargs)
+
+    def _arrow_to_pandas(self, table):
+        """Convert an Arrow table to pandas, keeping strings Arrow-backed.
+
+        Dictionary columns become pandas categoricals.
+        """
+        import pandas as pd
+        import pyarrow as pa
+
+        return table.to_pandas(
+            types_mapper=lambda t: pd.ArrowDtype(t) if pa.types.is_string(t) else None
+        )
+
+    def _clean_wage_columns(self, df, cols=None):
+        """Clean and convert wage columns to plain float32 (missing values as NaN).
+
+        By default only the configured wage level column and the wage columns
+        that end up in the output are converted.
+        """
+        import pandas as pd
+
+        wage_columns = self.WAGE_COLUMNS
+
+        if cols is None:
+            cols = [f"Level{self.config['wage_level'].upper()[1]}"]
+            output_columns = self.config.get('output', {}).get('columns')
+            if output_columns is None:
+                output_columns = wage_columns
+            cols += [col for col in wage_columns if col in output_columns and col not in cols]
+
+        # Converted columns are applied with assign() so slices of a larger
+        # frame can be passed in without copying them first
+        converted = {}
+        for col in cols:
             if col in df.columns:
-                # Remove currency symbols, commas, and convert to numeric
+                # Already converted (e.g. loaded from the Parquet cache)
+                if pd.api.types.is_numeric_dtype(df[col]):
+                    continue
+
+                # Plain numeric strings (most OFLC exports) skip the stripping pass.
+                # A sample decides; any value that then fails to parse falls
+                # through to the full clean below.
+                values = df[col].astype("string")
+                sample = values.head(64).dropna().astype(str)
+                if not sample.str.contains(r"[^0-9.\-]").any():
+                    numeric = pd.to_numeric(values, errors="coerce", downcast="float")
+                    # Empty strings are missing values too, not parse failures
+                    if numeric.isna().sum() == (values.fillna("") == "").sum():
+                        converted[col] = numeric.astype("float32")
+                        continue
+
+                # Remove currency symbols, commas, and convert to numeric.
+                # Fixed-string replaces avoid running the regex engine per value.
                 cleaned = (
-                    df[col]
-                    .astype(str)
-                    .str.replace(r"[^0-9.\-]", "", regex=True)
-                    .replace({"": pd.NA})
+                    values
+                    .str.replace("$", "", regex=False)
+                    .str.replace(",", "", regex=False)
+                    .str.strip()
                 )
-                df[col] = pd.to_numeric(cleaned, errors="coerce")
+                converted[col] = pd.to_numeric(
+                    cleaned, errors="coerce", downcast="float"
+                ).astype("float32")
 
-        return df
+        return df.assign(**converted) if converted else df
 
     def _filter_data(self, alc_data):
         """Filter data based on SOC code and wage level."""
-        print("\nFiltering data...")
+        import numpy as np
+        import pandas as pd
+
+        self._log("\nFiltering data...")
 
         # Get parameters
         soc_code = self.config['soc_code']
@@ -180,55 +398,59 @@ class LOCAnalyzer:
             print("✗ Error: 'SocCode' column not found in ALC data")
             sys.exit(1)
 
-        soc_mask = alc_data['SocCode'] == soc_code
-        soc_count = soc_mask.sum()
-
-        if soc_count == 0:
+        # Compare on the raw category codes to skip pandas' alignment and dtype dispatch
+        soc_categories = alc_data['SocCode'].cat.categories
+        try:
+            soc_index = soc_categories.get_loc(soc_code)
+        except KeyError:
             print(f"✗ Warning: No records found for SOC code '{soc_code}'")
-            print(f"  Available SOC codes (sample): {sorted(alc_data['SocCode'].unique())[:10]}")
+            print(f"  Available SOC codes (sample): {sorted(soc_categories)[:10]}")
             return pd.DataFrame()
 
-        print(f"✓ Found {soc_count:,} locations with SOC code '{soc_code}'")
-
-        # Apply wage filter
-        if operator == '>=':
-            wage_mask = alc_data[level_column] <= hourly_wage
-        elif operator == '>':
-            wage_mask = alc_data[level_column] < hourly_wage
-        elif operator == '<=':
-            wage_mask = alc_data[level_column] >= hourly_wage
-        elif operator == '<':
-            wage_mask = alc_data[level_column] > hourly_wage
-        else:
-            print(f"✗ Error: Invalid comparison operator '{operator}'")
-            sys.exit(1)
+        soc_mask = alc_data['SocCode'].cat.codes.to_numpy() == soc_index
+        soc_count = np.count_nonzero(soc_mask)
 
-        # Combine filters
-        combined_mask = soc_mask & wage_mask
-        filtered_data = alc_data[combined_mask].copy()
+        self._log("✓ Found {:,} locations with SOC code '{}'", soc_count, soc_code)
 
-        print(f"✓ Found {len(filtered_data):,} locations where ${hourly_wage} {operator} {level_column}")
-        print(f"  (Using wage level: {wage_level} → {level_column})")
+        # Only the SOC rows' wage level column needs cleaning before the wage filter
+        soc_data = alc_data.iloc[np.flatnonzero(soc_mask)]
+        soc_data = self._clean_wage_columns(soc_data, [level_column])
 
-        # Print statistics
-        if len(filtered_data) > 0:
-            level_stats = alc_data.loc[soc_mask, level_column].describe()
-            print(f"\n{level_column} wage statistics for SOC {soc_code}:")
-            print(f"  Min:  ${level_stats['min']:.2f}")
-            print(f"  25th: ${level_stats['25%']:.2f}")
-            print(f"  Median: ${level_stats['50%']:.2f}")
-            print(f"  75th: ${level_stats['75%']:.2f}")
-            print(f"  Max:  ${level_stats['max']:.2f}")
-            print(f"  Your wage (${hourly_wage}) is at the {((alc_data.loc[soc_mask, level_column] <= hourly_wage).sum() / soc_count * 100):.1f}th percentile")
+        # Apply wage filter
+        wage_arr = soc_data[level_column].to_numpy(dtype=np.float32, na_value=np.nan)
+        compare = getattr(np, self.COMPARISON_UFUNCS[operator])
+        wage_mask = compare(wage_arr, hourly_wage, out=np.empty(wage_arr.shape, dtype=bool))
+
+        # Select rows by position
+        filtered_data = soc_data.iloc[np.flatnonzero(wage_mask)]
+
+        self._log("✓ Found {:,} locations where ${} {} {}",
+                  len(filtered_data), hourly_wage, operator, level_column)
+        self._log("  (Using wage level: {} → {})", wage_level, level_column)
+
+        # Print statistics (skipped entirely when not verbose)
+        if self.verbose and len(filtered_data) > 0:
+            # One pass over the SOC wages already in wage_arr
+            stats = WageStats(
+                *np.nanpercentile(wage_arr, [0, 25, 50, 75, 100]).tolist(),
+                percentile=np.count_nonzero(wage_arr <= hourly_wage) / wage_arr.size
+            )
+            self._log("\n{} wage statistics for SOC {}:", level_column, soc_code)
+            self._log("  Min:  ${:.2f}", stats.min)
+            self._log("  25th: ${:.2f}", stats.q25)
+            self._log("  Median: ${:.2f}", stats.median)
+            self._log("  75th: ${:.2f}", stats.q75)
+            self._log("  Max:  ${:.2f}", stats.max)
+            self._log("  Your wage (${}) is at the {:.1f}th percentile", hourly_wage, stats.percentile * 100)
 
         return filtered_data
 
     def _merge_geography(self, filtered_data, geography_data):
         """Merge filtered data with geography information."""
-        print("\nMerging with geography data...")
+        self._log("\nMerging with geography data...")
 
         merged = filtered_data.merge(geography_data, on="Area", how="left")
-        print(f"✓ Merged data: {len(merged):,} rows")
+        self._log("✓ Merged data: {:,} rows", len(merged))
 
         # Check for missing geography info
         missing_geo = merged['AreaName'].isna().sum()
@@ -239,6 +461,9 @@ class LOCAnalyzer:
 
     def _prepare_output(self, merged_data):
         """Prepare final output with selected columns."""
+        import numpy as np
+        import pandas as pd
+
         # Get columns to include
         columns_config = self.config.get('output', {}).get('columns')
 
@@ -253,18 +478,24 @@ class LOCAnalyzer:
         else:
             columns = [col for col in columns_config if col in merged_data.columns]
 
-        final_data = merged_data[columns].copy()
+        final_data = merged_data[columns]
 
         # Sort by state and area name
         sort_columns = [col for col in ["StateAb", "AreaName"] if col in final_data.columns]
         if sort_columns:
-            final_data = final_data.sort_values(sort_columns, na_position="last")
+            # Sort on integer category codes instead of comparing strings;
+            # missing values (code -1) are pushed to the end
+            sort_keys = []
+            for col in reversed(sort_columns):
+                codes = pd.Categorical(final_data[col]).codes.astype(np.int32)
+                sort_keys.append(np.where(codes < 0, np.iinfo(np.int32).max, codes))
+            final_data = final_data.iloc[np.lexsort(sort_keys)]
 
         return final_data
 
     def _export_results(self, final_data):
         """Export results to file."""
-        print("\nExporting results...")
+        self._log("\nExporting results...")
 
         # Get output configuration
         output_config = self.config.get('output', {})
@@ -288,31 +519,69 @@ class LOCAnalyzer:
         # Export based on format
         if output_format.lower() == 'excel':
             output_file = output_path / f"{base_name}.xlsx"
+            excel_data = self._widen_wage_columns(final_data)
             try:
-                final_data.to_excel(output_file, index=False, engine='openpyxl')
-                print(f"✓ Exported to Excel: {output_file}")
+                self._write_excel_streaming(excel_data, output_file)
+                self._log("✓ Exported to Excel: {}", output_file)
             except ImportError:
-                print("  Warning: openpyxl not installed, trying xlsxwriter...")
+                print("  Warning: xlsxwriter not installed, trying openpyxl...")
                 try:
-                    final_data.to_excel(output_file, index=False, engine='xlsxwriter')
-                    print(f"✓ Exported to Excel: {output_file}")
+                    excel_data.to_excel(output_file, index=False, engine='openpyxl')
+                    self._log("✓ Exported to Excel: {}", output_file)
                 except ImportError:
                     print("  Error: No Excel engine available, falling back to CSV")
                     output_file = output_path / f"{base_name}.csv"
-                    final_data.to_csv(output_file, index=False)
-                    print(f"✓ Exported to CSV: {output_file}")
+                    final_data.to_csv(output_file, index=False, chunksize=65536)
+                    self._log("✓ Exported to CSV: {}", output_file)
         else:
             output_file = output_path / f"{base_name}.csv"
-            final_data.to_csv(output_file, index=False)
-            print(f"✓ Exported to CSV: {output_file}")
+            final_data.to_csv(output_file, index=False, chunksize=65536)
+            self._log("✓ Exported to CSV: {}", output_file)
 
         return output_file
 
+    def _widen_wage_columns(self, df):
+        """Convert float32 wage columns back to float64 rounded to cents.
+
+        Excel stores every number as a double, so float32 values would otherwise
+        show representation noise (e.g. 36.47999954223633).
+        """
+        float32_columns = [col for col in df.columns if df[col].dtype in ("float32", "Float32")]
+        if not float32_columns:
+            return df
+        return df.astype({col: "float64" for col in float32_columns}).round(
+            {col: 2 for col in float32_columns}
+        )
+
+    def _write_excel_streaming(self, df, output_file):
+        """Write a DataFrame to Excel row by row using xlsxwriter's constant_memory mode.
+
+        pandas' to_excel writes cells column by column, which constant_memory mode
+        cannot handle, so rows are written directly through the xlsxwriter API.
+        Missing values are mapped to blanks one row at a time, so memory stays
+        bounded by a single row.
+        """
+        import pandas as pd
+        import xlsxwriter
+
+        workbook = xlsxwriter.Workbook(str(output_file), {'constant_memory': True})
+        try:
+            worksheet = workbook.add_worksheet("Sheet1")
+            header_format = workbook.add_format({'bold': True, 'border': 1, 'align': 'center'})
+            worksheet.write_row(0, 0, list(df.columns), header_format)
+
+            for row_number, row in enumerate(df.itertuples(index=False, name=None), start=1):
+                worksheet.write_row(
+                    row_number, 0, [None if pd.isna(value) else value for value in row]
+                )
+        finally:
+            workbook.close()
+
     def run(self):
         """Run the complete analysis pipeline."""
-        print("=" * 70)
-        print("LOC ELIGIBILITY ANALYSIS")
-        print("=" * 70)
+        self._log("=" * 70)
+        self._log("LOC ELIGIBILITY ANALYSIS")
+        self._log("=" * 70)
 
         # Get data paths
         alc_path, geography_path = self._get_data_paths()
@@ -320,9 +589,6 @@ class LOCAnalyzer:
         # Load data
         alc_data, geography_data = self._load_data(alc_path, geography_path)
 
-        # Clean wage columns
-        alc_data = self._clean_wage_columns(alc_data)
-
         # Filter data
         filtered_data = self._filter_data(alc_data)
 
@@ -332,6 +598,9 @@ class LOCAnalyzer:
             print("=" * 70)
             return None
 
+        # Clean remaining wage columns on the (much smaller) filtered rows
+        filtered_data = self._clean_wage_columns(filtered_data)
+
         # Merge with geography
         merged_data = self._merge_geography(filtered_data, geography_data)
 
@@ -342,15 +611,15 @@ class LOCAnalyzer:
         output_file = self._export_results(final_data)
 
         # Print summary
-        print("\n" + "=" * 70)
-        print("ANALYSIS COMPLETE")
-        print("=" * 70)
-        print(f"Total eligible locations: {len(final_data):,}")
-        print(f"SOC Code: {self.config['soc_code']}")
-        print(f"Hourly Wage: ${self.config['hourly_wage']}")
-        print(f"Wage Level: {self.config['wage_level']}")
-        print(f"Output file: {output_file}")
-        print("=" * 70)
+        self._log("\n" + "=" * 70)
+        self._log("ANALYSIS COMPLETE")
+        self._log("=" * 70)
+        self._log("Total eligible locations: {:,}", len(final_data))
+        self._log("SOC Code: {}", self.config['soc_code'])
+        self._log("Hourly Wage: ${}", self.config['hourly_wage'])
+        self._log("Wage Level: {}", self.config['wage_level'])
+        self._log("Output file: {}", output_file)
+        self._log("=" * 70)
 
         return final_data
 
@@ -368,6 +637,8 @@ def main():
 
     args = parser.parse_args()
 
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+
     try:
         analyzer = LOCAnalyzer(config_path=args.config)
         analyzer.run()